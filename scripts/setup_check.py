@@ -1,34 +1,59 @@
 #!/usr/bin/env python3
 """Setup validation script for Google Calendar to Discord sync."""
 
+import os
 import sys
-from pathlib import Path
 
+SOURCE_FILES = (
+    ("src/gcal_to_discord/__init__.py", "Package init"),
+    ("src/gcal_to_discord/config.py", "Config module"),
+    ("src/gcal_to_discord/google_calendar.py", "Google Calendar client"),
+    ("src/gcal_to_discord/discord_client.py", "Discord client"),
+    ("src/gcal_to_discord/main.py", "Main entry point"),
+)
 
-def check_file_exists(filepath: Path, description: str) -> bool:
+
+def check_file_exists(filepath: str, description: str) -> bool:
     """Check if a file exists and report status."""
-    exists = filepath.exists()
+    exists = os.path.isfile(filepath)
     status = "✓" if exists else "✗"
     print(f"{status} {description}: {filepath}")
     return exists
 
 
+def parse_env_file(env_file: str) -> dict[str, str]:
+    """Parse KEY=value lines from a .env file in a single pass."""
+    values: dict[str, str] = {}
+    with open(env_file) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                values[key.strip()] = value.strip()
+    return values
+
+
 def main() -> int:
     """Run setup checks."""
     print("Google Calendar to Discord - Setup Validation")
     print("=" * 50)
     print()
 
-    project_root = Path(__file__).parent.parent
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env_file = os.path.join(project_root, ".env")
     all_checks_passed = True
 
     # Check critical configuration files
     print("Configuration Files:")
-    if not check_file_exists(project_root / ".env", ".env configuration file"):
+    env_exists = check_file_exists(env_file, ".env configuration file")
+    if not env_exists:
         print("  → Copy .env.example to .env and configure it")
         all_checks_passed = False
 
-    if not check_file_exists(project_root / "credentials.json", "Google OAuth2 credentials"):
+    credentials_file = os.path.join(project_root, "credentials.json")
+    if not check_file_exists(credentials_file, "Google OAuth2 credentials"):
         print("  → Download credentials.json from Google Cloud Console")
         all_checks_passed = False
 
@@ -36,28 +61,22 @@ def main() -> int:
 
     # Check source files
     print("Source Files:")
-    check_file_exists(project_root / "src/gcal_to_discord/__init__.py", "Package init")
-    check_file_exists(project_root / "src/gcal_to_discord/config.py", "Config module")
-    check_file_exists(
-        project_root / "src/gcal_to_discord/google_calendar.py", "Google Calendar client"
-    )
-    check_file_exists(project_root / "src/gcal_to_discord/discord_client.py", "Discord client")
-    check_file_exists(project_root / "src/gcal_to_discord/main.py", "Main entry point")
+    for relative_path, description in SOURCE_FILES:
+        check_file_exists(os.path.join(project_root, relative_path), description)
 
     print()
 
     # Check if .env has required variables (if it exists)
-    env_file = project_root / ".env"
-    if env_file.exists():
+    if env_exists:
         print("Environment Variables Check:")
         required_vars = ["DISCORD_BOT_TOKEN", "DISCORD_CHANNEL_ID"]
 
-        env_content = env_file.read_text()
+        env_values = parse_env_file(env_file)
 
         for var in required_vars:
-            if f"{var}=" in env_content:
-                value = [line for line in env_content.split("\n") if line.startswith(f"{var}=")]
-                if value and "your_" not in value[0].lower() and "here" not in value[0].lower():
+            if var in env_values:
+                value = env_values[var].lower()
+                if value and "your_" not in value and "here" not in value:
                     print(f"✓ {var} is configured")
                 else:
                     print(f"✗ {var} needs to be set (currently using placeholder)")
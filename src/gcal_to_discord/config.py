@@ -1,98 +1,111 @@
 """Configuration management for Google Calendar to Discord sync."""
 
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    # Discord Settings
+    discord_bot_token: str  # Discord bot token for authentication
+    discord_channel_id: int  # Discord channel ID to post events
+    # Optional prefix text to include before event embeds
+    # (e.g., '[Name] is thinking of attending:')
+    message_prefix: str | None = None
 
     # Google Calendar Settings
-    google_credentials_file: Path = Field(
-        default=Path("credentials.json"),
-        description="Path to Google OAuth2 credentials JSON file",
-    )
-    google_token_file: Path = Field(
-        default=Path("token.json"),
-        description="Path to store Google OAuth2 token",
-    )
-    google_calendar_id: str = Field(
-        default="primary",
-        description="Google Calendar ID to sync (use 'primary' for main calendar)",
-    )
-    google_scopes: list[str] = Field(
-        default=["https://www.googleapis.com/auth/calendar.readonly"],
-        description="Google API scopes",
-    )
-
-    # Discord Settings
-    discord_bot_token: str = Field(
-        ...,
-        description="Discord bot token for authentication",
-    )
-    discord_channel_id: int = Field(
-        ...,
-        description="Discord channel ID to post events",
-    )
-    message_prefix: str | None = Field(
-        default=None,
-        description="Optional prefix text to include before event embeds (e.g., '[Name] is thinking of attending:')",
+    google_credentials_file: Path = Path("credentials.json")  # OAuth2 credentials JSON file
+    google_token_file: Path = Path("token.json")  # Where to store the OAuth2 token
+    google_calendar_id: str = "primary"  # Use 'primary' for the main calendar
+    google_scopes: list[str] = field(
+        default_factory=lambda: ["https://www.googleapis.com/auth/calendar.readonly"]
     )
 
     # Sync Settings
-    sync_interval_minutes: int = Field(
-        default=30,
-        ge=5,
-        le=1440,
-        description="Interval between syncs in minutes (5-1440)",
-    )
-    days_ahead: int = Field(
-        default=7,
-        ge=1,
-        le=365,
-        description="Number of days ahead to sync events",
-    )
-    event_reminder_hours: int = Field(
-        default=1,
-        ge=0,
-        le=168,
-        description="Hours before event to send reminder (0 to disable)",
-    )
+    sync_interval_minutes: int = 30  # Interval between syncs in minutes (5-1440)
+    days_ahead: int = 7  # Number of days ahead to sync events (1-365)
+    event_reminder_hours: int = 1  # Hours before event to send reminder (0-168, 0 disables)
 
     # Logging Settings
-    log_level: str = Field(
-        default="INFO",
-        description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
-    )
+    log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+
+    def __post_init__(self) -> None:
+        """Validate ranges and normalize paths and log level."""
+        _check_range("sync_interval_minutes", self.sync_interval_minutes, 5, 1440)
+        _check_range("days_ahead", self.days_ahead, 1, 365)
+        _check_range("event_reminder_hours", self.event_reminder_hours, 0, 168)
+
+        log_level = self.log_level.upper()
+        if log_level not in VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {set(VALID_LOG_LEVELS)}")
+
+        # Frozen dataclass: normalized values have to bypass __setattr__
+        object.__setattr__(self, "log_level", log_level)
+        for name in ("google_credentials_file", "google_token_file"):
+            path = Path(getattr(self, name))
+            object.__setattr__(self, name, path if path.is_absolute() else Path.cwd() / path)
+
+
+def _check_range(name: str, value: int, low: int, high: int) -> None:
+    """Raise ValueError if value is outside the inclusive range [low, high]."""
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be between {low} and {high}, got {value}")
 
-    @field_validator("google_credentials_file", "google_token_file")
-    @classmethod
-    def validate_path(cls, v: Path) -> Path:
-        """Ensure path is absolute."""
-        if not v.is_absolute():
-            return Path.cwd() / v
-        return v
-
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return v_upper
 
+def _read_environment(env_file: str = ".env") -> dict[str, str]:
+    """
+    Read settings from the .env file and the process environment.
 
+    Keys are lowercased so lookups match field names case-insensitively.
+    Process environment variables take precedence over the .env file.
+    """
+    values = {
+        key.lower(): value for key, value in dotenv_values(env_file).items() if value is not None
+    }
+    values.update((key.lower(), value) for key, value in os.environ.items())
+    return values
+
+
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and validate application settings."""
-    return Settings()  # type: ignore[call-arg]
+    """
+    Load and validate application settings.
+
+    The result is cached for the lifetime of the process so the .env file is
+    only read and validated once. Call ``load_settings.cache_clear()`` to force
+    a reload (e.g. in tests).
+    """
+    env = _read_environment()
+
+    missing = [name for name in ("discord_bot_token", "discord_channel_id") if name not in env]
+    if missing:
+        raise ValueError(f"Missing required settings: {', '.join(n.upper() for n in missing)}")
+
+    kwargs: dict[str, object] = {
+        "discord_bot_token": env["discord_bot_token"],
+        "discord_channel_id": int(env["discord_channel_id"]),
+        "message_prefix": env.get("message_prefix"),
+    }
+    for name in ("google_credentials_file", "google_token_file"):
+        if name in env:
+            kwargs[name] = Path(env[name])
+    if "google_calendar_id" in env:
+        kwargs["google_calendar_id"] = env["google_calendar_id"]
+    if "google_scopes" in env:
+        kwargs["google_scopes"] = list(json.loads(env["google_scopes"]))
+    for name in ("sync_interval_minutes", "days_ahead", "event_reminder_hours"):
+        if name in env:
+            kwargs[name] = int(env[name])
+    if "log_level" in env:
+        kwargs["log_level"] = env["log_level"]
+
+    return Settings(**kwargs)  # type: ignore[arg-type]
@@ -1,6 +1,7 @@
 """Discord integration module."""
 
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from typing import Any
 
 import discord
@@ -11,6 +12,45 @@ from gcal_to_discord.google_calendar import GoogleCalendarEvent
 
 logger = structlog.get_logger()
 
+# Discord allows 5 messages per 5 seconds per channel; more concurrent sends
+# would only queue up behind discord.py's rate limiter
+SEND_CONCURRENCY = 5
+
+# Attempts per message when Discord still answers 429 after discord.py's own retries
+MAX_SEND_ATTEMPTS = 3
+
+EventSource = Iterable[GoogleCalendarEvent] | AsyncIterable[GoogleCalendarEvent]
+
+
+def _extract_eid(url: str) -> str | None:
+    """Extract the ``eid`` query parameter from a Google Calendar event URL."""
+    eid = url.partition("eid=")[2].partition("&")[0]
+    return eid or None
+
+
+def _url_key(url: str) -> str:
+    """Index key for an event URL: its eid, or the full URL if it has none."""
+    return _extract_eid(url) or url
+
+
+def _retry_after(error: discord.HTTPException) -> float:
+    """Seconds to back off after a 429, from Discord's rate limit headers."""
+    headers = getattr(error.response, "headers", None) or {}
+    try:
+        return float(headers.get("X-RateLimit-Reset-After", 1.0))
+    except ValueError:
+        return 1.0
+
+
+async def _iterate_events(events: EventSource) -> AsyncIterator[GoogleCalendarEvent]:
+    """Iterate over a plain or async iterable of events."""
+    if isinstance(events, AsyncIterable):
+        async for event in events:
+            yield event
+    else:
+        for event in events:
+            yield event
+
 
 class DiscordEventMessage:
     """Represents a Discord message for a calendar event."""
@@ -35,14 +75,35 @@ class DiscordClient:
 
         self.client = discord.Client(intents=intents)
         self.channel: discord.TextChannel | None = None
-        self.event_message_map: dict[str, int] = {}  # event_id -> message_id
-        self._url_to_message_map: dict[str, int] = {}  # event_url -> message_id
+        # Single index keyed by both event_id and event URL eid -> message_id
+        self._msg_index: dict[str, int] = {}
         self._channel_ready = asyncio.Event()  # Signal when channel is ready
         self._connect_started = asyncio.Event()  # Signal when connection has started
+        # Cleared while a 429 backoff is in progress so all senders pause together
+        self._send_allowed = asyncio.Event()
+        self._send_allowed.set()
 
         # Set up event handlers
         self._setup_event_handlers()
 
+    def _lookup(self, event_id: str, url_key: str | None) -> int | None:
+        """Find the message ID for an event by event ID, falling back to its URL key."""
+        message_id = self._msg_index.get(event_id)
+        if message_id is None and url_key is not None:
+            message_id = self._msg_index.get(url_key)
+        return message_id
+
+    def _register(self, event_id: str, url_key: str | None, message_id: int) -> None:
+        """Index a message under both the event ID and the event URL key."""
+        self._msg_index[event_id] = message_id
+        if url_key is not None:
+            self._msg_index[url_key] = message_id
+
+    def _unregister(self, message_id: int) -> None:
+        """Drop every index key (event ID and URL) pointing at a message."""
+        for key in [key for key, value in self._msg_index.items() if value == message_id]:
+            del self._msg_index[key]
+
     def _setup_event_handlers(self) -> None:
         """Set up Discord client event handlers."""
 
@@ -92,6 +153,36 @@ class DiscordClient:
             self.logger.error("discord_connection_failed", error=str(e))
             raise
 
+    async def connect_rest(self) -> None:
+        """
+        Log in and fetch the target channel over REST, without a gateway connection.
+
+        Posting messages and reading channel history only need the HTTP API, so
+        one-shot syncs use this instead of connect()/wait_until_ready(). It also
+        keeps scheduled runs from using up Discord's daily gateway session limit.
+        """
+        try:
+            await self.client.login(self.settings.discord_bot_token)
+            channel = await self.client.fetch_channel(self.settings.discord_channel_id)
+        except discord.LoginFailure as e:
+            self.logger.error("discord_login_failed", error=str(e))
+            raise
+        except discord.HTTPException as e:
+            self.logger.error("failed_to_get_channel", error=str(e), status=e.status)
+            raise
+
+        if not isinstance(channel, discord.TextChannel):
+            self.logger.error("invalid_channel", channel_id=self.settings.discord_channel_id)
+            raise RuntimeError(f"Channel {self.settings.discord_channel_id} is not a text channel")
+
+        self.channel = channel
+        self._channel_ready.set()
+        self.logger.info(
+            "connected_to_channel",
+            channel_name=channel.name,
+            channel_id=channel.id,
+        )
+
     async def disconnect(self) -> None:
         """Disconnect from Discord."""
         if self.client:
@@ -111,17 +202,29 @@ class DiscordClient:
             self.logger.error("discord_ready_timeout", timeout=timeout)
             raise
 
-    async def rebuild_event_mapping(self, limit: int = 200) -> None:
+    async def rebuild_event_mapping(
+        self,
+        limit: int = 200,
+        expected_urls: set[str] | None = None,
+        stream_done: asyncio.Event | None = None,
+    ) -> None:
         """
         Rebuild event-message mapping by scanning Discord channel history.
 
-        This method scans recent messages in the Discord channel and rebuilds
-        the event_message_map by matching embed URLs (Google Calendar event links).
-        This allows the bot to update existing messages instead of creating duplicates
-        in one-shot execution mode.
+        This method scans recent messages in the Discord channel and adds their
+        embed URLs (Google Calendar event links) to the message index. This allows
+        the bot to update existing messages instead of creating duplicates in
+        one-shot execution mode. Keys already in the index are kept, so a failed
+        scan never forgets messages the bot has posted or seen before.
 
         Args:
             limit: Maximum number of messages to scan (default: 200)
+            expected_urls: Event URLs being synced. When given, the scan stops as soon
+                as every one of them has been found instead of reading all ``limit``
+                messages.
+            stream_done: Set once a stream being synced has been fully read. When
+                given, ``expected_urls`` may still grow until then, and the early
+                exit only applies after it is set.
         """
         if not self.channel:
             self.logger.error("channel_not_available_for_rebuild")
@@ -130,14 +233,35 @@ class DiscordClient:
         self.logger.info("rebuilding_event_mapping", limit=limit)
 
         try:
-            # Clear existing mapping
-            self.event_message_map.clear()
-
-            # Scan channel history
+            if expected_urls is not None and not expected_urls and stream_done is None:
+                self.logger.info("event_mapping_rebuild_skipped", reason="no_expected_urls")
+                return
+
+            # Scan channel history into a separate dict, merged only once the scan
+            # succeeds. Existing keys are kept so messages already posted or seen
+            # are still matched if this scan fails or they scroll past ``limit``.
+            found: dict[str, int] = {}
             message_count = 0
             mapping_count = 0
+            remaining = (
+                {_url_key(url) for url in expected_urls}
+                if expected_urls is not None and stream_done is None
+                else None
+            )
 
             async for message in self.channel.history(limit=limit):
+                if (
+                    remaining is None
+                    and expected_urls is not None
+                    and stream_done is not None
+                    and stream_done.is_set()
+                ):
+                    # The stream has been read to the end, so the expected set is
+                    # final; stop if everything in it was already found
+                    remaining = {_url_key(url) for url in expected_urls} - found.keys()
+                    if not remaining:
+                        break
+
                 message_count += 1
 
                 # Check if message has embeds and is from this bot
@@ -146,18 +270,17 @@ class DiscordClient:
 
                     # Extract event URL from embed
                     if embed.url:
-                        # The URL is the Google Calendar event htmlLink
-                        # We need to extract the event ID from this URL or use the URL as the key
-                        # Google Calendar event URLs look like:
+                        # The URL is the Google Calendar event htmlLink, which looks like
                         # https://www.google.com/calendar/event?eid=...
-
-                        # For now, we'll use the URL as a key to find matching events
-                        # We'll need to update the mapping approach slightly
+                        # Key on the eid: it is short and independent of parameter order
                         event_url = embed.url
+                        url_key = _url_key(event_url)
 
-                        # Store URL and message ID for matching during sync
-                        self._url_to_message_map[event_url] = message.id
+                        # Store URL key and message ID for matching during sync
+                        found[url_key] = message.id
                         mapping_count += 1
+                        if remaining is not None:
+                            remaining.discard(url_key)
 
                         self.logger.debug(
                             "found_event_message",
@@ -165,6 +288,11 @@ class DiscordClient:
                             event_url=event_url,
                         )
 
+                        # Stop paging once every expected event has been found
+                        if remaining is not None and not remaining:
+                            break
+
+            self._msg_index.update(found)
             self.logger.info(
                 "event_mapping_rebuilt",
                 messages_scanned=message_count,
@@ -197,51 +325,44 @@ class DiscordClient:
         Returns:
             Message ID if successful (existing or new), None otherwise
         """
+        message_id, _ = await self._upsert_event(event)
+        return message_id
+
+    async def _upsert_event(self, event: GoogleCalendarEvent) -> tuple[int | None, bool]:
+        """
+        Post a calendar event to Discord, or skip if it already exists.
+
+        Returns:
+            Tuple of (message ID or None on failure, whether the message already existed)
+        """
         if not self.channel:
             self.logger.error("channel_not_available")
-            return None
+            return None, False
 
         try:
-            embed_data = event.to_discord_embed()
-            embed = discord.Embed.from_dict(embed_data)
-
-            # Check if message already exists for this event
-            # First check by event ID (in-memory mapping)
-            existing_message_id = self.event_message_map.get(event.id)
-
-            # If not found by event ID, check by URL (for one-shot mode persistence)
-            if not existing_message_id and event.html_link:
-                existing_message_id = self._url_to_message_map.get(event.html_link)
-                if existing_message_id:
-                    # Found by URL, update the event_message_map for this session
-                    self.event_message_map[event.id] = existing_message_id
-                    self.logger.debug(
-                        "found_existing_message_by_url",
-                        event_id=event.id,
-                        message_id=existing_message_id,
-                        event_url=event.html_link,
-                    )
+            # Check if message already exists for this event, by event ID or by
+            # URL (the latter survives restarts via rebuild_event_mapping). The URL
+            # key is derived once and reused if a new message is registered.
+            url_key = _url_key(event.html_link) if event.html_link else None
+            existing_message_id = self._lookup(event.id, url_key)
 
             if existing_message_id:
-                # Message already exists, skip this event
+                # Message already exists, skip this event. Index the event ID too
+                # so later lookups hit on the first probe.
+                self._msg_index[event.id] = existing_message_id
                 self.logger.info(
                     "skipped_existing_event",
                     event_id=event.id,
                     message_id=existing_message_id,
                     event_summary=event.summary,
                 )
-                return existing_message_id
+                return existing_message_id, True
 
-            # Create new message with optional prefix
-            if self.settings.message_prefix:
-                message = await self.channel.send(content=self.settings.message_prefix, embed=embed)
-            else:
-                message = await self.channel.send(embed=embed)
-            self.event_message_map[event.id] = message.id
+            # Only build the embed once we know a new message is needed
+            embed = event.to_discord_embed()
 
-            # Also store URL mapping for future one-shot runs
-            if event.html_link:
-                self._url_to_message_map[event.html_link] = message.id
+            message = await self._send(self.channel, embed)
+            self._register(event.id, url_key, message.id)
 
             self.logger.info(
                 "created_event_message",
@@ -249,7 +370,7 @@ class DiscordClient:
                 message_id=message.id,
                 event_summary=event.summary,
             )
-            return message.id
+            return message.id, False
 
         except discord.HTTPException as e:
             self.logger.error(
@@ -258,14 +379,44 @@ class DiscordClient:
                 error=str(e),
                 status=e.status,
             )
-            return None
+            return None, False
         except Exception as e:
             self.logger.error(
                 "unexpected_error_upserting_event",
                 event_id=event.id,
                 error=str(e),
             )
-            return None
+            return None, False
+
+    async def _send(self, channel: discord.TextChannel, embed: discord.Embed) -> discord.Message:
+        """
+        Send an event embed with the optional message prefix.
+
+        discord.py already waits out per-route rate limits. If Discord still
+        answers 429, every sender pauses for the advertised reset time before
+        this one retries, instead of each worker hammering the route on its own.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            await self._send_allowed.wait()
+            try:
+                if self.settings.message_prefix:
+                    return await channel.send(content=self.settings.message_prefix, embed=embed)
+                return await channel.send(embed=embed)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempts == MAX_SEND_ATTEMPTS:
+                    raise
+                retry_after = _retry_after(e)
+                self.logger.warning("discord_rate_limited", retry_after=retry_after)
+                # The first worker to hit the limit holds the pause; others just
+                # wait for it to lift
+                if self._send_allowed.is_set():
+                    self._send_allowed.clear()
+                    try:
+                        await asyncio.sleep(retry_after)
+                    finally:
+                        self._send_allowed.set()
 
     async def delete_event_message(self, event_id: str) -> bool:
         """
@@ -281,7 +432,7 @@ class DiscordClient:
             self.logger.error("channel_not_available")
             return False
 
-        message_id = self.event_message_map.get(event_id)
+        message_id = self._msg_index.get(event_id)
         if not message_id:
             self.logger.warning("no_message_found_for_event", event_id=event_id)
             return False
@@ -289,7 +440,7 @@ class DiscordClient:
         try:
             message = await self.channel.fetch_message(message_id)
             await message.delete()
-            del self.event_message_map[event_id]
+            self._unregister(message_id)
             self.logger.info(
                 "deleted_event_message",
                 event_id=event_id,
@@ -302,7 +453,7 @@ class DiscordClient:
                 event_id=event_id,
                 message_id=message_id,
             )
-            del self.event_message_map[event_id]
+            self._unregister(message_id)
             return True
         except discord.HTTPException as e:
             self.logger.error(
@@ -321,8 +472,9 @@ class DiscordClient:
 
     async def sync_events(
         self,
-        events: list[GoogleCalendarEvent],
+        events: EventSource,
         rebuild_mapping: bool = True,
+        max_concurrency: int = SEND_CONCURRENCY,
     ) -> dict[str, Any]:
         """
         Sync multiple calendar events to Discord.
@@ -330,40 +482,97 @@ class DiscordClient:
         By default, rebuilds the event-message mapping from Discord channel history
         before syncing. This prevents duplicate messages in one-shot execution mode.
 
+        Events may be a list or an async stream (e.g. from
+        GoogleCalendarClient.stream_upcoming_events). For a stream, the mapping is
+        rebuilt once the first event arrives, while later pages are still being
+        fetched; an empty stream never reads the channel history. Once the stream
+        is exhausted, the history scan stops as soon as every streamed event has
+        been found, as it does for a list.
+
+        Events are fed through a queue to ``max_concurrency`` workers, so new
+        messages are sent concurrently (up to Discord's per-channel rate limit)
+        while later events are still arriving. New messages may therefore land in
+        the channel slightly out of start-time order.
+
         Args:
-            events: List of GoogleCalendarEvent objects to sync
+            events: GoogleCalendarEvent objects to sync
             rebuild_mapping: If True, rebuild event-message mapping before sync (default: True)
+            max_concurrency: Maximum number of events upserted at once (default: 5)
 
         Returns:
             Dictionary with sync statistics
         """
         # Rebuild event mapping from Discord channel history
         # This prevents duplicates in one-shot mode by finding existing messages
+        rebuild_task: asyncio.Task[None] | None = None
+        # For a stream, the rebuild starts with the first event (see the feed loop)
+        # and stops early once the stream is exhausted and every URL it yielded
+        # has been found in the channel history
+        rebuild_on_first_event = False
+        stream_urls: set[str] = set()
+        stream_done = asyncio.Event()
         if rebuild_mapping:
-            await self.rebuild_event_mapping()
+            if isinstance(events, AsyncIterable):
+                rebuild_on_first_event = True
+            elif events := list(events):
+                await self.rebuild_event_mapping(
+                    expected_urls={event.html_link for event in events if event.html_link}
+                )
 
         stats = {
-            "total": len(events),
+            "total": 0,
             "created": 0,
             "skipped": 0,
             "failed": 0,
         }
 
-        for event in events:
-            # Check if message already exists before calling upsert_event
-            existing_message_id = self.event_message_map.get(event.id) or (
-                self._url_to_message_map.get(event.html_link) if event.html_link else None
-            )
-
-            message_id = await self.upsert_event(event)
-
-            if message_id:
-                if existing_message_id:
-                    stats["skipped"] += 1
+        # None is the end-of-stream sentinel, one per worker. The queue is unbounded
+        # (a sync is capped at max_results events) so the stream can be read to the
+        # end while workers wait for the rebuild, letting the rebuild stop early.
+        queue: asyncio.Queue[GoogleCalendarEvent | None] = asyncio.Queue()
+
+        async def worker() -> None:
+            while (event := await queue.get()) is not None:
+                # The mapping must be complete before the first existence check.
+                # rebuild_task is always set before the first event is queued.
+                if rebuild_task is not None:
+                    await rebuild_task
+
+                message_id, existed = await self._upsert_event(event)
+
+                if message_id:
+                    if existed:
+                        stats["skipped"] += 1
+                    else:
+                        stats["created"] += 1
                 else:
-                    stats["created"] += 1
-            else:
-                stats["failed"] += 1
+                    stats["failed"] += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        try:
+            async for event in _iterate_events(events):
+                if rebuild_on_first_event:
+                    if event.html_link:
+                        stream_urls.add(event.html_link)
+                    if rebuild_task is None:
+                        rebuild_task = asyncio.create_task(
+                            self.rebuild_event_mapping(
+                                expected_urls=stream_urls, stream_done=stream_done
+                            )
+                        )
+                stats["total"] += 1
+                await queue.put(event)
+            stream_done.set()
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            # Only still running if the feed loop failed or this call was cancelled;
+            # wait for the cancellations so no worker outlives sync_events
+            background = workers if rebuild_task is None else [*workers, rebuild_task]
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
 
         self.logger.info("sync_completed", **stats)
         return stats
@@ -1,23 +1,104 @@
 """Google Calendar integration module."""
 
-from datetime import datetime, timedelta
-from typing import Any
-
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any, ClassVar
+from urllib.parse import quote
+
+import aiohttp
+import discord
+import orjson
 import structlog
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import-untyped]
-from googleapiclient.discovery import build  # type: ignore[import-untyped]
-from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
 
 from gcal_to_discord.config import Settings
 
 logger = structlog.get_logger()
 
+# Datetime parse failures logged per sync; later ones are only counted
+MAX_PARSE_WARNINGS = 5
+
+CALENDAR_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
+
+# Partial response: only the fields GoogleCalendarEvent reads
+EVENT_FIELDS = (
+    "nextPageToken,items(id,summary,description,location,htmlLink,start,end,attendees/email)"
+)
+
+# Google only gzips responses for clients whose User-Agent mentions gzip
+USER_AGENT = "gcal-to-discord (gzip)"
+
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def _rfc3339_utc(dt: datetime) -> str:
+    """Format an aware UTC datetime as RFC 3339 with a ``Z`` suffix."""
+    # isoformat ends in "+00:00"; a "+" would need escaping in the query string
+    return dt.isoformat(timespec="seconds")[:-6] + "Z"
+
+
+def _format_date(dt: datetime) -> str:
+    """Format as ``strftime("%B %d, %Y")`` would, without the locale machinery."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _format_time(dt: datetime) -> str:
+    """Format as ``strftime("%I:%M %p")`` would, without the locale machinery."""
+    return f"{(dt.hour - 1) % 12 + 1:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(dt_string: str) -> datetime | None:
+    """
+    Parse an ISO 8601 date or timestamp, returning None if it is invalid.
+
+    Results are memoized since events in a sync window (recurring events in
+    particular) frequently share start and end times.
+    """
+    try:
+        # Handles both date-only and full timestamps, including a "Z" suffix
+        return datetime.fromisoformat(dt_string)
+    except ValueError:
+        return None
+
 
 class GoogleCalendarEvent:
     """Represents a Google Calendar event."""
 
+    # One instance is built per API result, so skip the per-instance __dict__
+    __slots__ = (
+        "id",
+        "summary",
+        "description",
+        "location",
+        "html_link",
+        "start_time",
+        "end_time",
+        "is_all_day",
+        "attendees",
+        "_embed",
+    )
+
+    # Datetime parse failures since the last reset_parse_failures()
+    parse_failures: ClassVar[int] = 0
+
     def __init__(self, event_data: dict[str, Any]) -> None:
         """Initialize event from Google Calendar API response."""
         self.id: str = event_data.get("id", "")
@@ -44,57 +125,61 @@ class GoogleCalendarEvent:
             for attendee in event_data.get("attendees", [])
             if attendee.get("email")
         ]
+        self._embed: discord.Embed | None = None
 
     @staticmethod
     def _parse_datetime(dt_string: str | None) -> datetime | None:
-        """Parse datetime string from Google Calendar API."""
+        """
+        Parse datetime string from Google Calendar API.
+
+        Every unparseable string is counted, even when the parse itself is
+        answered from _parse_iso's cache.
+        """
         if not dt_string:
             return None
-        try:
-            # Try parsing ISO format with timezone
-            if "T" in dt_string:
-                return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
-            # Try parsing date-only format
-            return datetime.fromisoformat(dt_string)
-        except (ValueError, AttributeError) as e:
-            logger.warning("failed_to_parse_datetime", dt_string=dt_string, error=str(e))
-            return None
+        parsed = _parse_iso(dt_string)
+        if parsed is None:
+            GoogleCalendarEvent.parse_failures += 1
+            if GoogleCalendarEvent.parse_failures <= MAX_PARSE_WARNINGS:
+                logger.warning("failed_to_parse_datetime", dt_string=dt_string)
+        return parsed
+
+    @classmethod
+    def reset_parse_failures(cls) -> int:
+        """Reset the parse failure counter, returning its previous value."""
+        failures, cls.parse_failures = cls.parse_failures, 0
+        return failures
+
+    def to_discord_embed(self) -> discord.Embed:
+        """
+        Convert event to a Discord embed.
 
-    def to_discord_embed(self) -> dict[str, Any]:
-        """Convert event to Discord embed format."""
-        embed: dict[str, Any] = {
-            "title": self.summary,
-            "url": self.html_link,
-            "color": 0x4285F4,  # Google Calendar blue
-            "fields": [],
-        }
+        The embed is built once and cached on the instance; functools.cached_property
+        is not an option because the class uses __slots__.
+        """
+        if self._embed is not None:
+            return self._embed
+
+        embed = discord.Embed(
+            title=self.summary,
+            url=self.html_link or None,
+            color=0x4285F4,  # Google Calendar blue
+        )
 
         # Add time field
         if self.start_time:
             if self.is_all_day:
-                time_str = self.start_time.strftime("%B %d, %Y")
+                time_str = _format_date(self.start_time)
             else:
-                time_str = self.start_time.strftime("%B %d, %Y at %I:%M %p")
+                time_str = f"{_format_date(self.start_time)} at {_format_time(self.start_time)}"
                 if self.end_time:
-                    time_str += f" - {self.end_time.strftime('%I:%M %p')}"
-
-            embed["fields"].append(
-                {
-                    "name": "⏰ Time",
-                    "value": time_str,
-                    "inline": False,
-                }
-            )
+                    time_str += f" - {_format_time(self.end_time)}"
+
+            embed.add_field(name="⏰ Time", value=time_str, inline=False)
 
         # Add location if present
         if self.location:
-            embed["fields"].append(
-                {
-                    "name": "📍 Location",
-                    "value": self.location,
-                    "inline": False,
-                }
-            )
+            embed.add_field(name="📍 Location", value=self.location, inline=False)
 
         # Add description if present
         if self.description:
@@ -104,30 +189,24 @@ class GoogleCalendarEvent:
                 if len(self.description) > 1024
                 else self.description
             )
-            embed["fields"].append(
-                {
-                    "name": "📝 Description",
-                    "value": desc,
-                    "inline": False,
-                }
-            )
+            embed.add_field(name="📝 Description", value=desc, inline=False)
 
         # Add attendees if present
         if self.attendees:
             attendees_str = ", ".join(self.attendees[:10])  # Limit to first 10
             if len(self.attendees) > 10:
                 attendees_str += f" (+{len(self.attendees) - 10} more)"
-            embed["fields"].append(
-                {
-                    "name": "👥 Attendees",
-                    "value": attendees_str,
-                    "inline": False,
-                }
-            )
+            embed.add_field(name="👥 Attendees", value=attendees_str, inline=False)
 
+        self._embed = embed
         return embed
 
 
+def _token_digest(serialized: str) -> bytes:
+    """Return the sha256 digest of serialized credentials."""
+    return hashlib.sha256(serialized.encode()).digest()
+
+
 class GoogleCalendarClient:
     """Client for interacting with Google Calendar API."""
 
@@ -135,21 +214,28 @@ class GoogleCalendarClient:
         """Initialize Google Calendar client."""
         self.settings = settings
         self.credentials: Credentials | None = None
-        self.service: Any | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._saved_token_digest: bytes | None = None  # sha256 of last token.json write
         self.logger = logger.bind(component="google_calendar")
 
     def authenticate(self) -> None:
-        """Authenticate with Google Calendar API using OAuth2."""
-        creds = None
+        """
+        Authenticate with Google Calendar API using OAuth2.
+
+        Credentials are kept in memory, so token.json is only read on the first
+        call; later calls reuse (and if needed refresh) the cached credentials.
+        """
+        creds = self.credentials
         token_file = self.settings.google_token_file
 
-        # Load existing token if available
-        if token_file.exists():
+        # Load existing token if none is cached yet
+        if creds is None and token_file.exists():
             try:
                 creds = Credentials.from_authorized_user_file(
                     str(token_file),
                     self.settings.google_scopes,
                 )
+                self._saved_token_digest = _token_digest(creds.to_json())
                 self.logger.info("loaded_existing_credentials", token_file=str(token_file))
             except Exception as e:
                 self.logger.warning("failed_to_load_credentials", error=str(e))
@@ -170,6 +256,12 @@ class GoogleCalendarClient:
                         f"Credentials file not found: {self.settings.google_credentials_file}"
                     )
 
+                # Only needed for the interactive first-run flow, so scheduled
+                # runs with a saved token never import it
+                from google_auth_oauthlib.flow import (  # type: ignore[import-untyped]
+                    InstalledAppFlow,
+                )
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     str(self.settings.google_credentials_file),
                     self.settings.google_scopes,
@@ -177,67 +269,165 @@ class GoogleCalendarClient:
                 creds = flow.run_local_server(port=0)
                 self.logger.info("obtained_new_credentials")
 
-            # Save credentials for next run
-            token_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(token_file, "w") as token:
-                token.write(creds.to_json())
-            self.logger.info("saved_credentials", token_file=str(token_file))
+            self._save_credentials(creds)
 
         self.credentials = creds
-        self.service = build("calendar", "v3", credentials=creds)
         self.logger.info("authentication_successful")
 
-    def get_upcoming_events(
+    def _save_credentials(self, creds: Credentials) -> None:
+        """Save credentials for the next run, skipping the write if nothing changed."""
+        serialized = creds.to_json()
+        digest = _token_digest(serialized)
+        if digest == self._saved_token_digest:
+            return
+
+        token_file = self.settings.google_token_file
+        token_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(token_file, "w") as token:
+            token.write(serialized)
+        self._saved_token_digest = digest
+        self.logger.info("saved_credentials", token_file=str(token_file))
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def _get_access_token(self) -> str:
+        """Return a valid OAuth2 access token, refreshing it if it has expired."""
+        if not self.credentials:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+
+        if not self.credentials.valid:
+            # google-auth refreshes synchronously; keep it off the event loop
+            await asyncio.to_thread(self.credentials.refresh, Request())
+            self.logger.info("refreshed_credentials")
+            self._save_credentials(self.credentials)
+
+        return str(self.credentials.token)
+
+    async def _list_events_page(
+        self,
+        time_min: str,
+        time_max: str,
+        max_results: int,
+        page_token: str | None,
+    ) -> dict[str, Any]:
+        """Fetch a single page of events from the Calendar REST API."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+            )
+
+        params = {
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "maxResults": str(max_results),
+            "singleEvents": "true",
+            "orderBy": "startTime",
+            "fields": EVENT_FIELDS,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+
+        url = CALENDAR_EVENTS_URL.format(
+            calendar_id=quote(self.settings.google_calendar_id, safe="")
+        )
+        headers = {"Authorization": f"Bearer {await self._get_access_token()}"}
+
+        async with self._session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            page: dict[str, Any] = orjson.loads(await response.read())
+            return page
+
+    async def stream_upcoming_events(
         self,
         days_ahead: int = 7,
         max_results: int = 100,
-    ) -> list[GoogleCalendarEvent]:
+    ) -> AsyncIterator[GoogleCalendarEvent]:
         """
-        Fetch upcoming events from Google Calendar.
+        Stream upcoming events from Google Calendar, one API page at a time.
+
+        Events from a page are yielded as soon as it arrives, so callers can start
+        working on them before later pages have been fetched.
 
         Args:
             days_ahead: Number of days ahead to fetch events
             max_results: Maximum number of events to return
 
-        Returns:
-            List of GoogleCalendarEvent objects
+        Yields:
+            GoogleCalendarEvent objects in start time order
         """
-        if not self.service:
+        if not self.credentials:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
 
-        try:
-            now = datetime.utcnow()
-            time_min = now.isoformat() + "Z"
-            time_max = (now + timedelta(days=days_ahead)).isoformat() + "Z"
+        now = datetime.now(UTC)
+        time_min = _rfc3339_utc(now)
+        time_max = _rfc3339_utc(now + timedelta(days=days_ahead))
 
-            self.logger.info(
-                "fetching_events",
-                calendar_id=self.settings.google_calendar_id,
-                time_min=time_min,
-                time_max=time_max,
-            )
+        self.logger.info(
+            "fetching_events",
+            calendar_id=self.settings.google_calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+        )
 
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=self.settings.google_calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
+        event_count = 0
+        page_token: str | None = None
+        GoogleCalendarEvent.reset_parse_failures()
+
+        while event_count < max_results:
+            try:
+                page = await self._list_events_page(
+                    time_min,
+                    time_max,
+                    max_results - event_count,
+                    page_token,
                 )
-                .execute()
+            except aiohttp.ClientResponseError as e:
+                self.logger.error("http_error_fetching_events", error=str(e), status=e.status)
+                raise
+            except Exception as e:
+                self.logger.error("unexpected_error_fetching_events", error=str(e))
+                raise
+
+            for item in page.get("items", [])[: max_results - event_count]:
+                event_count += 1
+                yield GoogleCalendarEvent(item)
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+
+        self.logger.info("fetched_events", event_count=event_count)
+
+        parse_failures = GoogleCalendarEvent.reset_parse_failures()
+        if parse_failures > MAX_PARSE_WARNINGS:
+            self.logger.warning(
+                "suppressed_datetime_parse_warnings",
+                suppressed=parse_failures - MAX_PARSE_WARNINGS,
             )
 
-            events = events_result.get("items", [])
-            self.logger.info("fetched_events", event_count=len(events))
+    async def get_upcoming_events(
+        self,
+        days_ahead: int = 7,
+        max_results: int = 100,
+    ) -> list[GoogleCalendarEvent]:
+        """
+        Fetch upcoming events from Google Calendar.
 
-            return [GoogleCalendarEvent(event) for event in events]
+        Args:
+            days_ahead: Number of days ahead to fetch events
+            max_results: Maximum number of events to return
 
-        except HttpError as e:
-            self.logger.error("http_error_fetching_events", error=str(e))
-            raise
-        except Exception as e:
-            self.logger.error("unexpected_error_fetching_events", error=str(e))
-            raise
+        Returns:
+            List of GoogleCalendarEvent objects
+        """
+        return [
+            event
+            async for event in self.stream_upcoming_events(
+                days_ahead=days_ahead,
+                max_results=max_results,
+            )
+        ]
@@ -2,34 +2,72 @@
 
 import argparse
 import asyncio
+import contextlib
+import logging
 import signal
 import sys
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
+import orjson
 import structlog
 
 from gcal_to_discord.config import load_settings
-from gcal_to_discord.discord_client import DiscordClient
-from gcal_to_discord.google_calendar import GoogleCalendarClient
+
+if TYPE_CHECKING:
+    from gcal_to_discord.discord_client import DiscordClient
+    from gcal_to_discord.google_calendar import GoogleCalendarClient
+
+# Seconds to wait before retrying after a failed sync
+RETRY_DELAY_SECONDS = 30
+
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 def configure_logging(log_level: str) -> None:
-    """Configure structured logging with structlog."""
+    """
+    Configure structured logging with structlog.
+
+    Args:
+        log_level: Upper-case level name, as validated by Settings
+    """
+    level = _LOG_LEVELS[log_level]
+
+    processors: list[structlog.typing.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+    ]
+    if level == logging.DEBUG:
+        # Per-call stack/exception inspection is only worth it when debugging
+        processors += [structlog.processors.StackInfoRenderer(), structlog.dev.set_exc_info]
+    processors.append(structlog.processors.TimeStamper(fmt="iso", utc=True))
+
+    logger_factory: Callable[..., structlog.typing.WrappedLogger]
+    if sys.stdout.isatty():
+        # Interactive use: human-readable, colored output
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        # Cron, containers and pipes: one JSON object per line. orjson emits
+        # bytes, so they are written straight to the binary stdout.
+        processors += [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ]
+        logger_factory = structlog.BytesLoggerFactory()
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.dev.ConsoleRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            int(getattr(structlog.stdlib, log_level.upper(), 20))  # 20 = INFO level
-        ),
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
     )
 
 
@@ -39,27 +77,45 @@ class CalendarSyncService:
     def __init__(self) -> None:
         """Initialize the sync service."""
         self.settings = load_settings()
-        self.logger = structlog.get_logger()
+        self.logger = structlog.get_logger().bind(component="sync_service")
         self.gcal_client: GoogleCalendarClient | None = None
         self.discord_client: DiscordClient | None = None
-        self.running = False
         self._shutdown_event = asyncio.Event()
+        self._consecutive_failures = 0
 
     def setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
+        """
+        Set up signal handlers for graceful shutdown.
 
-        def signal_handler(signum: int, frame: Any) -> None:
-            """Handle shutdown signals."""
-            self.logger.info("received_shutdown_signal", signal=signum)
-            self._shutdown_event.set()
+        Must be called from within the running event loop. The handlers run as
+        regular loop callbacks, so setting the shutdown event is loop-safe.
+        """
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._on_signal, signum)
+            except NotImplementedError:
+                # Windows loops don't support add_signal_handler; a plain signal
+                # handler can interrupt the loop mid-step, so hand off to it
+                signal.signal(
+                    signum,
+                    lambda signum, _frame: loop.call_soon_threadsafe(self._on_signal, signum),
+                )
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+    def _on_signal(self, signum: int) -> None:
+        """Handle shutdown signals."""
+        self.logger.info("received_shutdown_signal", signal=signum)
+        self._shutdown_event.set()
 
     async def initialize(self) -> None:
         """Initialize Google Calendar and Discord clients."""
         self.logger.info("initializing_service")
 
+        # Imported here so --help and argument errors don't pay for loading
+        # discord.py, aiohttp and google-auth
+        from gcal_to_discord.discord_client import DiscordClient
+        from gcal_to_discord.google_calendar import GoogleCalendarClient
+
         # Initialize Google Calendar client
         self.gcal_client = GoogleCalendarClient(self.settings)
         try:
@@ -81,16 +137,17 @@ class CalendarSyncService:
         try:
             self.logger.info("starting_sync")
 
-            # Fetch events from Google Calendar
-            events = self.gcal_client.get_upcoming_events(days_ahead=self.settings.days_ahead)
+            # Stream events from Google Calendar into Discord. sync_events rebuilds
+            # the event-message mapping from channel history once the first event
+            # arrives (never, if there are none) while later pages are fetched.
+            events = self.gcal_client.stream_upcoming_events(days_ahead=self.settings.days_ahead)
+            stats = await self.discord_client.sync_events(events)
+            self._consecutive_failures = 0
 
-            if not events:
+            if not stats["total"]:
                 self.logger.info("no_events_to_sync")
                 return
 
-            # Sync events to Discord
-            stats = await self.discord_client.sync_events(events)
-
             self.logger.info(
                 "sync_completed",
                 total_events=stats["total"],
@@ -100,12 +157,20 @@ class CalendarSyncService:
             )
 
         except Exception as e:
-            self.logger.error("sync_failed", error=str(e), exc_info=True)
+            self._consecutive_failures += 1
+            failures = self._consecutive_failures
+            # During an outage, only render the traceback on the 1st, 2nd, 4th,
+            # 8th, ... consecutive failure
+            self.logger.error(
+                "sync_failed",
+                error=str(e),
+                consecutive_failures=failures,
+                exc_info=failures & (failures - 1) == 0,
+            )
             raise
 
     async def run_sync_loop(self) -> None:
-        """Run continuous sync loop."""
-        self.running = True
+        """Run continuous sync loop until shutdown is requested."""
         sync_interval_seconds = self.settings.sync_interval_minutes * 60
 
         self.logger.info(
@@ -113,23 +178,19 @@ class CalendarSyncService:
             sync_interval_minutes=self.settings.sync_interval_minutes,
         )
 
-        while self.running and not self._shutdown_event.is_set():
+        while not self._shutdown_event.is_set():
             try:
                 await self.sync_once()
+                delay = sync_interval_seconds
             except Exception as e:
                 self.logger.error("sync_iteration_failed", error=str(e))
+                # Retry a failed sync sooner than the regular interval
+                delay = min(sync_interval_seconds, RETRY_DELAY_SECONDS)
 
-            # Wait for next sync interval or shutdown signal
-            try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=sync_interval_seconds,
-                )
-                # If we get here, shutdown was signaled
-                break
-            except TimeoutError:
-                # Timeout is normal, continue to next sync
-                continue
+            # Wait for the next sync or until a shutdown signal sets the event
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self._shutdown_event.wait()
 
         self.logger.info("sync_loop_stopped")
 
@@ -143,45 +204,33 @@ class CalendarSyncService:
         try:
             await self.initialize()
 
-            # Start Discord client in background
             if self.discord_client:
-                # Start Discord connection in background
-                discord_task = asyncio.create_task(self.discord_client.connect())
-
-                # Wait until Discord is connected and channel is ready
-                await self.discord_client.wait_until_ready(timeout=30)
-
                 if run_once:
-                    # Run a single sync and exit
+                    # A single sync only needs Discord's REST API, so skip the
+                    # gateway connection entirely
+                    await self.discord_client.connect_rest()
                     await self.sync_once()
-                    # Cancel the Discord task since we're done
-                    discord_task.cancel()
-                    try:
-                        await discord_task
-                    except asyncio.CancelledError:
-                        pass
                 else:
-                    # Start continuous sync loop
-                    sync_task = asyncio.create_task(self.run_sync_loop())
-
-                    # Wait for either task to complete (or fail)
-                    done, pending = await asyncio.wait(
-                        [discord_task, sync_task],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-
-                    # Check for exceptions in completed tasks
-                    for task in done:
-                        if task.exception():
-                            raise task.exception()  # type: ignore
+                    # Run the Discord connection and the sync loop as one unit: if
+                    # either fails, the other is cancelled and the error propagates
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            discord_task = tg.create_task(self.discord_client.connect())
+
+                            # Wait until Discord is connected and channel is ready
+                            await self.discord_client.wait_until_ready(timeout=30)
+
+                            # Whichever finishes first (shutdown, or Discord
+                            # disconnecting) takes the other one down with it
+                            sync_task = tg.create_task(self.run_sync_loop())
+                            sync_task.add_done_callback(lambda _: discord_task.cancel())
+                            discord_task.add_done_callback(lambda _: sync_task.cancel())
+                    except ExceptionGroup as eg:
+                        # Raise a lone failure as itself, as one-shot mode does, so
+                        # callers and logs see the real error rather than the group
+                        if len(eg.exceptions) == 1:
+                            raise eg.exceptions[0] from None
+                        raise
 
         except Exception as e:
             self.logger.error("service_start_failed", error=str(e), exc_info=True)
@@ -192,7 +241,9 @@ class CalendarSyncService:
     async def shutdown(self) -> None:
         """Shutdown the service gracefully."""
         self.logger.info("shutting_down_service")
-        self.running = False
+
+        if self.gcal_client:
+            await self.gcal_client.close()
 
         if self.discord_client:
             await self.discord_client.disconnect()
@@ -207,8 +258,10 @@ async def async_main(run_once: bool = False) -> int:
     Args:
         run_once: If True, run a single sync and exit. If False, run continuous loop.
     """
+    # Configure logging before any client is built. load_settings() is cached,
+    # so the service below reuses these settings rather than re-reading .env.
+    configure_logging(load_settings().log_level)
     service = CalendarSyncService()
-    configure_logging(service.settings.log_level)
     logger = structlog.get_logger()
 
     try:
@@ -271,7 +324,13 @@ Examples:
 
         os.environ["ENV_FILE"] = args.env_file
 
-    exit_code = asyncio.run(async_main(run_once=args.once))
+    try:
+        # Optional libuv-based event loop (install the "speedups" extra)
+        import uvloop
+    except ImportError:
+        exit_code = asyncio.run(async_main(run_once=args.once))
+    else:
+        exit_code = uvloop.run(async_main(run_once=args.once))
     sys.exit(exit_code)
 
 
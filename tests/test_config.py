@@ -1,9 +1,10 @@
 """Tests for configuration management."""
 
+from pathlib import Path
+
 import pytest
-from pydantic import ValidationError
 
-from gcal_to_discord.config import Settings
+from gcal_to_discord.config import Settings, load_settings
 
 
 def test_settings_default_values() -> None:
@@ -30,7 +31,7 @@ def test_settings_validation_sync_interval() -> None:
     assert settings.sync_interval_minutes == 60
 
     # Invalid sync interval (too low)
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         Settings(
             discord_bot_token="test_token",
             discord_channel_id=12345,
@@ -38,7 +39,7 @@ def test_settings_validation_sync_interval() -> None:
         )
 
     # Invalid sync interval (too high)
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         Settings(
             discord_bot_token="test_token",
             discord_channel_id=12345,
@@ -57,7 +58,7 @@ def test_settings_validation_log_level() -> None:
     assert settings.log_level == "DEBUG"
 
     # Invalid log level
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         Settings(
             discord_bot_token="test_token",
             discord_channel_id=12345,
@@ -68,9 +69,52 @@ def test_settings_validation_log_level() -> None:
 def test_settings_required_fields() -> None:
     """Test that required fields are enforced."""
     # Missing discord_bot_token
-    with pytest.raises(ValidationError):
-        Settings(discord_channel_id=12345)
+    with pytest.raises(TypeError):
+        Settings(discord_channel_id=12345)  # type: ignore[call-arg]
 
     # Missing discord_channel_id
-    with pytest.raises(ValidationError):
-        Settings(discord_bot_token="test_token")
+    with pytest.raises(TypeError):
+        Settings(discord_bot_token="test_token")  # type: ignore[call-arg]
+
+
+def test_load_settings_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that load_settings returns the same instance until the cache is cleared."""
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "test_token")
+    monkeypatch.setenv("DISCORD_CHANNEL_ID", "12345")
+    load_settings.cache_clear()
+
+    try:
+        first = load_settings()
+        assert load_settings() is first
+
+        load_settings.cache_clear()
+        assert load_settings() is not first
+    finally:
+        load_settings.cache_clear()
+
+
+def test_load_settings_reads_env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that load_settings parses .env and lets the environment override it."""
+    (tmp_path / ".env").write_text(
+        "# comment\n"
+        "DISCORD_BOT_TOKEN=file_token\n"
+        "DISCORD_CHANNEL_ID=42\n"
+        "DAYS_AHEAD=14\n"
+        "log_level=debug\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DISCORD_BOT_TOKEN", raising=False)
+    monkeypatch.delenv("DISCORD_CHANNEL_ID", raising=False)
+    monkeypatch.setenv("DAYS_AHEAD", "21")
+    load_settings.cache_clear()
+
+    try:
+        settings = load_settings()
+    finally:
+        load_settings.cache_clear()
+
+    assert settings.discord_bot_token == "file_token"
+    assert settings.discord_channel_id == 42
+    assert settings.days_ahead == 21
+    assert settings.log_level == "DEBUG"
+    assert settings.google_token_file == tmp_path / "token.json"
@@ -0,0 +1,231 @@
+"""Tests for Google Calendar event parsing."""
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gcal_to_discord.config import Settings
+from gcal_to_discord.google_calendar import (
+    MAX_PARSE_WARNINGS,
+    GoogleCalendarClient,
+    GoogleCalendarEvent,
+    _format_date,
+    _format_time,
+    _rfc3339_utc,
+)
+
+
+def test_parse_datetime_with_z_suffix() -> None:
+    """Test that a trailing Z is parsed as UTC."""
+    parsed = GoogleCalendarEvent._parse_datetime("2025-01-01T10:00:00Z")
+    assert parsed == datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def test_parse_datetime_date_only() -> None:
+    """Test that all-day dates parse to midnight."""
+    parsed = GoogleCalendarEvent._parse_datetime("2025-01-01")
+    assert parsed is not None
+    assert parsed.date() == date(2025, 1, 1)
+    assert parsed.tzinfo is None
+
+
+def test_parse_datetime_invalid() -> None:
+    """Test that empty and malformed strings return None."""
+    assert GoogleCalendarEvent._parse_datetime(None) is None
+    assert GoogleCalendarEvent._parse_datetime("") is None
+    assert GoogleCalendarEvent._parse_datetime("not a date") is None
+
+
+def test_event_parses_start_and_end() -> None:
+    """Test that events pick up timed and all-day boundaries."""
+    timed = GoogleCalendarEvent(
+        {
+            "id": "timed",
+            "start": {"dateTime": "2025-01-01T10:00:00-05:00"},
+            "end": {"dateTime": "2025-01-01T11:30:00-05:00"},
+        }
+    )
+    assert not timed.is_all_day
+    assert timed.start_time is not None and timed.end_time is not None
+    assert (timed.end_time - timed.start_time).total_seconds() == 5400
+
+    all_day = GoogleCalendarEvent(
+        {"id": "all_day", "start": {"date": "2025-01-01"}, "end": {"date": "2025-01-02"}}
+    )
+    assert all_day.is_all_day
+    assert all_day.summary == "No Title"
+
+
+def test_to_discord_embed_is_cached() -> None:
+    """Test that the embed is built once per event."""
+    event = GoogleCalendarEvent(
+        {
+            "id": "cached",
+            "summary": "Cached Event",
+            "location": "Room 1",
+            "start": {"dateTime": "2025-01-01T10:00:00Z"},
+            "end": {"dateTime": "2025-01-01T11:00:00Z"},
+        }
+    )
+
+    embed = event.to_discord_embed()
+
+    assert event.to_discord_embed() is embed
+    assert embed.title == "Cached Event"
+    assert [field.name for field in embed.fields] == ["⏰ Time", "📍 Location"]
+
+
+def test_format_helpers_match_strftime() -> None:
+    """Test that the locale-free formatters match the C-locale strftime output."""
+    for month in range(1, 13):
+        for hour in range(24):
+            dt = datetime(2025, month, 3, hour, 7)
+            assert _format_date(dt) == dt.strftime("%B %d, %Y")
+            assert _format_time(dt) == dt.strftime("%I:%M %p")
+
+
+def test_to_discord_embed_time_field() -> None:
+    """Test the rendered time field for timed and all-day events."""
+    timed = GoogleCalendarEvent(
+        {
+            "id": "timed",
+            "start": {"dateTime": "2025-01-01T13:05:00Z"},
+            "end": {"dateTime": "2025-01-01T14:30:00Z"},
+        }
+    )
+    assert timed.to_discord_embed().fields[0].value == ("January 01, 2025 at 01:05 PM - 02:30 PM")
+
+    all_day = GoogleCalendarEvent({"id": "all_day", "start": {"date": "2025-07-04"}})
+    assert all_day.to_discord_embed().fields[0].value == "July 04, 2025"
+
+
+@pytest.fixture
+def gcal_client() -> GoogleCalendarClient:
+    """Create an authenticated Google Calendar client."""
+    client = GoogleCalendarClient(
+        Settings(
+            discord_bot_token="test_token",
+            discord_channel_id=1,
+            google_calendar_id="team@group.calendar.google.com",
+        )
+    )
+    client.credentials = Mock(valid=True, token="access-token")
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stream_upcoming_events_follows_page_tokens(
+    gcal_client: GoogleCalendarClient,
+) -> None:
+    """Test that events are streamed across pages until the token runs out."""
+    pages = {
+        None: {"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "page2"},
+        "page2": {"items": [{"id": "c"}]},
+    }
+    requested_tokens = []
+
+    async def list_events_page(time_min, time_max, max_results, page_token):  # type: ignore[no-untyped-def]
+        requested_tokens.append(page_token)
+        return pages[page_token]
+
+    gcal_client._list_events_page = list_events_page  # type: ignore[method-assign]
+
+    events = await gcal_client.get_upcoming_events(days_ahead=7)
+
+    assert [event.id for event in events] == ["a", "b", "c"]
+    assert requested_tokens == [None, "page2"]
+
+
+@pytest.mark.asyncio
+async def test_stream_upcoming_events_respects_max_results(
+    gcal_client: GoogleCalendarClient,
+) -> None:
+    """Test that streaming stops at max_results even if more pages exist."""
+    gcal_client._list_events_page = AsyncMock(  # type: ignore[method-assign]
+        return_value={"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "more"}
+    )
+
+    events = await gcal_client.get_upcoming_events(max_results=3)
+
+    assert [event.id for event in events] == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_list_events_page_request(gcal_client: GoogleCalendarClient) -> None:
+    """Test the REST request built for a page of events."""
+    response = AsyncMock()
+    response.raise_for_status = Mock()
+    response.read.return_value = b'{"items": []}'
+    request = AsyncMock()
+    request.__aenter__.return_value = response
+    gcal_client._session = Mock()
+    gcal_client._session.get.return_value = request
+
+    page = await gcal_client._list_events_page("t-min", "t-max", 50, "token-2")
+
+    assert page == {"items": []}
+    args, kwargs = gcal_client._session.get.call_args
+    assert args == (
+        "https://www.googleapis.com/calendar/v3/calendars/team%40group.calendar.google.com/events",
+    )
+    assert kwargs["headers"] == {"Authorization": "Bearer access-token"}
+    assert kwargs["params"]["pageToken"] == "token-2"
+    assert kwargs["params"]["maxResults"] == "50"
+    assert kwargs["params"]["fields"].startswith("nextPageToken,items(")
+
+
+def test_authenticate_reuses_cached_credentials(
+    gcal_client: GoogleCalendarClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached, valid credentials skip reading token.json."""
+    load = Mock()
+    monkeypatch.setattr(
+        "gcal_to_discord.google_calendar.Credentials.from_authorized_user_file", load
+    )
+
+    gcal_client.authenticate()
+
+    load.assert_not_called()
+
+
+def test_save_credentials_skips_unchanged_token(tmp_path: Path) -> None:
+    """Test that token.json is only rewritten when the serialized token changes."""
+    client = GoogleCalendarClient(
+        Settings(
+            discord_bot_token="test_token",
+            discord_channel_id=1,
+            google_token_file=tmp_path / "token.json",
+        )
+    )
+    creds = Mock()
+    creds.to_json.return_value = '{"token": "one"}'
+
+    client._save_credentials(creds)
+    (tmp_path / "token.json").write_text("tampered")
+    client._save_credentials(creds)
+    assert (tmp_path / "token.json").read_text() == "tampered"
+
+    creds.to_json.return_value = '{"token": "two"}'
+    client._save_credentials(creds)
+    assert (tmp_path / "token.json").read_text() == '{"token": "two"}'
+
+
+def test_parse_failures_are_counted() -> None:
+    """Test that every parse failure is counted in each sync, cached or not."""
+    for _sync in range(2):
+        GoogleCalendarEvent.reset_parse_failures()
+
+        for i in range(MAX_PARSE_WARNINGS + 2):
+            assert GoogleCalendarEvent._parse_datetime(f"garbage-{i}") is None
+
+        assert GoogleCalendarEvent.reset_parse_failures() == MAX_PARSE_WARNINGS + 2
+        assert GoogleCalendarEvent.parse_failures == 0
+
+
+def test_rfc3339_utc() -> None:
+    """Test RFC 3339 formatting of UTC timestamps for API queries."""
+    assert _rfc3339_utc(datetime(2025, 1, 1, 10, 0, 5, 123456, tzinfo=UTC)) == (
+        "2025-01-01T10:00:05Z"
+    )
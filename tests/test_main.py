@@ -0,0 +1,274 @@
+"""Tests for the sync service lifecycle."""
+
+import asyncio
+import os
+import signal
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+import structlog
+
+from gcal_to_discord.config import load_settings
+from gcal_to_discord.discord_client import DiscordClient
+from gcal_to_discord.google_calendar import GoogleCalendarEvent
+from gcal_to_discord.main import CalendarSyncService, configure_logging
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> CalendarSyncService:
+    """Create a sync service from test environment settings."""
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "test_token")
+    monkeypatch.setenv("DISCORD_CHANNEL_ID", "12345")
+    load_settings.cache_clear()
+    try:
+        return CalendarSyncService()
+    finally:
+        load_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_signal_sets_shutdown_event(service: CalendarSyncService) -> None:
+    """Test that SIGTERM is delivered through the loop and requests shutdown."""
+    service.setup_signal_handlers()
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(service._shutdown_event.wait(), timeout=1)
+    finally:
+        loop = asyncio.get_running_loop()
+        loop.remove_signal_handler(signal.SIGINT)
+        loop.remove_signal_handler(signal.SIGTERM)
+
+
+@pytest.mark.asyncio
+async def test_signal_fallback_without_loop_support(
+    service: CalendarSyncService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the signal.signal fallback used where add_signal_handler is unsupported."""
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "add_signal_handler", Mock(side_effect=NotImplementedError))
+    previous = {signum: signal.getsignal(signum) for signum in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        service.setup_signal_handlers()
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(service._shutdown_event.wait(), timeout=1)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def test_configure_logging_honors_level(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the configured level filters log output."""
+    try:
+        configure_logging("WARNING")
+        logger = structlog.get_logger()
+        logger.info("hidden_event")
+        logger.warning("shown_event")
+        out = capsys.readouterr().out
+        assert "hidden_event" not in out
+        assert "shown_event" in out
+
+        configure_logging("DEBUG")
+        structlog.get_logger().debug("debug_event")
+        assert "debug_event" in capsys.readouterr().out
+    finally:
+        structlog.reset_defaults()
+
+
+def test_configure_logging_renders_json_when_not_a_tty(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that non-interactive output is one JSON object per line."""
+    try:
+        configure_logging("INFO")
+        structlog.get_logger().info("json_event", answer=42)
+        record = orjson.loads(capsys.readouterr().out)
+        assert record["event"] == "json_event"
+        assert record["answer"] == 42
+        assert record["level"] == "info"
+    finally:
+        structlog.reset_defaults()
+
+
+def _mock_clients(service: CalendarSyncService) -> AsyncMock:
+    """Replace client setup with a Discord client whose connection never ends."""
+    discord_client = AsyncMock()
+
+    async def connect() -> None:
+        await asyncio.Event().wait()
+
+    discord_client.connect = AsyncMock(side_effect=connect)
+
+    async def initialize() -> None:
+        service.gcal_client = AsyncMock()
+        service.discord_client = discord_client
+
+    service.initialize = initialize  # type: ignore[method-assign]
+    return discord_client
+
+
+@pytest.mark.asyncio
+async def test_start_returns_when_sync_loop_stops(service: CalendarSyncService) -> None:
+    """Test that a finished sync loop tears down the Discord connection."""
+    discord_client = _mock_clients(service)
+    service.run_sync_loop = AsyncMock()  # type: ignore[method-assign]
+
+    await asyncio.wait_for(service.start(), timeout=1)
+
+    service.run_sync_loop.assert_awaited_once()
+    discord_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_propagates_sync_loop_error(service: CalendarSyncService) -> None:
+    """Test that an error stopping the sync loop is raised from start()."""
+    discord_client = _mock_clients(service)
+    service.run_sync_loop = AsyncMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await asyncio.wait_for(service.start(), timeout=1)
+
+    discord_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_returns_when_discord_disconnects(service: CalendarSyncService) -> None:
+    """Test that a closed Discord connection stops the sync loop."""
+    discord_client = _mock_clients(service)
+    discord_client.connect = AsyncMock()
+
+    async def run_sync_loop() -> None:
+        await asyncio.Event().wait()
+
+    service.run_sync_loop = run_sync_loop  # type: ignore[method-assign]
+
+    await asyncio.wait_for(service.start(), timeout=1)
+
+    discord_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_propagates_discord_error(service: CalendarSyncService) -> None:
+    """Test that a failed Discord connection is raised from start() as itself."""
+    discord_client = _mock_clients(service)
+    discord_client.connect = AsyncMock(side_effect=ConnectionError("gateway down"))
+
+    async def run_sync_loop() -> None:
+        await asyncio.Event().wait()
+
+    service.run_sync_loop = run_sync_loop  # type: ignore[method-assign]
+
+    with structlog.testing.capture_logs() as logs:
+        with pytest.raises(ConnectionError, match="gateway down"):
+            await asyncio.wait_for(service.start(), timeout=1)
+
+    failures = [log for log in logs if log["event"] == "service_start_failed"]
+    assert [log["error"] for log in failures] == ["gateway down"]
+    discord_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_once_skips_gateway(service: CalendarSyncService) -> None:
+    """Test that a one-shot run syncs over REST without connecting to the gateway."""
+    discord_client = _mock_clients(service)
+    service.sync_once = AsyncMock()  # type: ignore[method-assign]
+
+    await asyncio.wait_for(service.start(run_once=True), timeout=1)
+
+    discord_client.connect_rest.assert_awaited_once()
+    discord_client.connect.assert_not_called()
+    service.sync_once.assert_awaited_once()
+    discord_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_loop_retries_failure_until_shutdown(
+    service: CalendarSyncService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed sync is retried early and shutdown ends the loop."""
+    monkeypatch.setattr("gcal_to_discord.main.RETRY_DELAY_SECONDS", 0)
+    calls = 0
+
+    async def sync_once() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        service._shutdown_event.set()
+
+    service.sync_once = sync_once  # type: ignore[method-assign]
+
+    await asyncio.wait_for(service.run_sync_loop(), timeout=1)
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_failure_tracebacks_back_off(service: CalendarSyncService) -> None:
+    """Test that tracebacks are only logged on power-of-two consecutive failures."""
+    service.gcal_client = Mock()
+    service.discord_client = Mock()
+    service.discord_client.sync_events = AsyncMock(side_effect=RuntimeError("outage"))
+
+    with structlog.testing.capture_logs() as logs:
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await service.sync_once()
+
+        service.discord_client.sync_events = AsyncMock(
+            return_value={"total": 0, "created": 0, "skipped": 0, "failed": 0}
+        )
+        await service.sync_once()
+
+    failures = [log for log in logs if log["event"] == "sync_failed"]
+    assert [log["exc_info"] for log in failures] == [True, True, False, True]
+    assert service._consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_once_stops_history_scan_when_events_found(
+    service: CalendarSyncService,
+) -> None:
+    """Test that a streamed sync only scans history until its events are found."""
+    messages = []
+    for i in range(5):
+        message = Mock()
+        message.author.id = 999
+        message.embeds = [Mock()]
+        message.embeds[0].url = f"https://www.google.com/calendar/event?eid=posted{i}"
+        message.id = 4000 + i
+        messages.append(message)
+
+    scanned = []
+
+    async def history(limit: int):  # type: ignore[no-untyped-def]
+        for message in messages:
+            await asyncio.sleep(0)
+            scanned.append(message.id)
+            yield message
+
+    async def stream_upcoming_events(days_ahead: int):  # type: ignore[no-untyped-def]
+        for i in range(2):
+            await asyncio.sleep(0)
+            yield GoogleCalendarEvent(
+                {
+                    "id": f"posted_event{i}",
+                    "htmlLink": f"https://www.google.com/calendar/event?eid=posted{i}",
+                    "start": {"dateTime": "2025-01-01T10:00:00Z"},
+                }
+            )
+
+    service.gcal_client = Mock()
+    service.gcal_client.stream_upcoming_events = stream_upcoming_events
+    channel = Mock()
+    channel.history = history
+    channel.send = AsyncMock()
+    service.discord_client = DiscordClient(service.settings)
+    service.discord_client.channel = channel
+    service.discord_client.client = Mock()
+    service.discord_client.client.user.id = 999
+
+    await service.sync_once()
+
+    assert scanned == [4000, 4001]
+    channel.send.assert_not_called()
@@ -1,14 +1,24 @@
 """Tests for URL matching to prevent duplicate messages."""
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
+import discord
 import pytest
 
 from gcal_to_discord.config import Settings
-from gcal_to_discord.discord_client import DiscordClient
+from gcal_to_discord.discord_client import DiscordClient, _extract_eid
 from gcal_to_discord.google_calendar import GoogleCalendarEvent
 
 
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Yield items as an async iterator, like a channel history."""
+    for item in items:
+        yield item
+
+
 @pytest.fixture
 def settings() -> Settings:
     """Create test settings."""
@@ -27,25 +37,8 @@ def discord_client(settings: Settings) -> DiscordClient:
 @pytest.mark.asyncio
 async def test_rebuild_event_mapping_empty_channel(discord_client: DiscordClient) -> None:
     """Test rebuilding event mapping with empty channel."""
-
-    # Mock channel with no messages - use same AsyncIterator pattern
-    class AsyncIterator:
-        def __init__(self, items):
-            self.items = items
-            self.index = 0
-
-        def __aiter__(self):
-            return self
-
-        async def __anext__(self):
-            if self.index >= len(self.items):
-                raise StopAsyncIteration
-            item = self.items[self.index]
-            self.index += 1
-            return item
-
     mock_channel = Mock()
-    mock_channel.history.return_value = AsyncIterator([])
+    mock_channel.history.return_value = _aiter([])
     discord_client.channel = mock_channel
     discord_client.client = Mock()
     discord_client.client.user = Mock()
@@ -53,8 +46,7 @@ async def test_rebuild_event_mapping_empty_channel(discord_client: DiscordClient
 
     await discord_client.rebuild_event_mapping()
 
-    assert len(discord_client._url_to_message_map) == 0
-    assert len(discord_client.event_message_map) == 0
+    assert len(discord_client._msg_index) == 0
 
 
 @pytest.mark.asyncio
@@ -73,24 +65,8 @@ async def test_rebuild_event_mapping_with_existing_messages(discord_client: Disc
     mock_message_2.embeds[0].url = "https://www.google.com/calendar/event?eid=event2"
     mock_message_2.id = 1002
 
-    # Mock channel with messages - history() must return an async iterator
-    class AsyncIterator:
-        def __init__(self, items):
-            self.items = items
-            self.index = 0
-
-        def __aiter__(self):
-            return self
-
-        async def __anext__(self):
-            if self.index >= len(self.items):
-                raise StopAsyncIteration
-            item = self.items[self.index]
-            self.index += 1
-            return item
-
     mock_channel = Mock()
-    mock_channel.history.return_value = AsyncIterator([mock_message_1, mock_message_2])
+    mock_channel.history.return_value = _aiter([mock_message_1, mock_message_2])
     discord_client.channel = mock_channel
     discord_client.client = Mock()
     discord_client.client.user = Mock()
@@ -98,15 +74,9 @@ async def test_rebuild_event_mapping_with_existing_messages(discord_client: Disc
 
     await discord_client.rebuild_event_mapping()
 
-    assert len(discord_client._url_to_message_map) == 2
-    assert (
-        discord_client._url_to_message_map["https://www.google.com/calendar/event?eid=event1"]
-        == 1001
-    )
-    assert (
-        discord_client._url_to_message_map["https://www.google.com/calendar/event?eid=event2"]
-        == 1002
-    )
+    assert len(discord_client._msg_index) == 2
+    assert discord_client._msg_index["event1"] == 1001
+    assert discord_client._msg_index["event2"] == 1002
 
 
 @pytest.mark.asyncio
@@ -114,7 +84,7 @@ async def test_upsert_event_finds_by_url(discord_client: DiscordClient) -> None:
     """Test that upsert_event finds existing messages by URL and skips them."""
     # Set up URL mapping (as if rebuild_event_mapping was called)
     event_url = "https://www.google.com/calendar/event?eid=test123"
-    discord_client._url_to_message_map[event_url] = 5000
+    discord_client._msg_index["test123"] = 5000
 
     # Mock channel (should not be used since we skip)
     mock_channel = AsyncMock()
@@ -135,7 +105,7 @@ async def test_upsert_event_finds_by_url(discord_client: DiscordClient) -> None:
 
     # Should find existing message by URL and skip it (not update)
     assert result == 5000
-    assert discord_client.event_message_map["new_event_123"] == 5000
+    assert discord_client._msg_index["new_event_123"] == 5000
     # Channel methods should NOT be called (no fetch or edit)
     mock_channel.fetch_message.assert_not_called()
     mock_channel.send.assert_not_called()
@@ -145,7 +115,7 @@ async def test_upsert_event_finds_by_url(discord_client: DiscordClient) -> None:
 async def test_upsert_event_creates_new_when_url_not_found(discord_client: DiscordClient) -> None:
     """Test that upsert_event creates new message when URL not found."""
     # Empty URL mapping
-    discord_client._url_to_message_map = {}
+    discord_client._msg_index = {}
 
     # Mock channel to create new message
     mock_new_message = Mock()
@@ -170,16 +140,340 @@ async def test_upsert_event_creates_new_when_url_not_found(discord_client: Disco
 
     # Should create new message
     assert result == 6000
-    assert discord_client.event_message_map["brand_new_event"] == 6000
-    assert (
-        discord_client._url_to_message_map["https://www.google.com/calendar/event?eid=brandnew"]
-        == 6000
-    )
+    assert discord_client._msg_index["brand_new_event"] == 6000
+    assert discord_client._msg_index["brandnew"] == 6000
     mock_channel.send.assert_called_once()
 
 
 def test_url_mapping_initialized(discord_client: DiscordClient) -> None:
-    """Test that URL mapping is initialized in __init__."""
-    assert hasattr(discord_client, "_url_to_message_map")
-    assert isinstance(discord_client._url_to_message_map, dict)
-    assert len(discord_client._url_to_message_map) == 0
+    """Test that the message index is initialized in __init__."""
+    assert hasattr(discord_client, "_msg_index")
+    assert isinstance(discord_client._msg_index, dict)
+    assert len(discord_client._msg_index) == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_events_counts_created_and_skipped(discord_client: DiscordClient) -> None:
+    """Test that sync_events classifies events from the upsert result."""
+    discord_client._msg_index["known"] = 7000
+
+    mock_new_message = Mock()
+    mock_new_message.id = 7001
+    mock_channel = AsyncMock()
+    mock_channel.send = AsyncMock(return_value=mock_new_message)
+    discord_client.channel = mock_channel
+
+    events = [
+        GoogleCalendarEvent(
+            {
+                "id": "known_event",
+                "summary": "Known Event",
+                "htmlLink": "https://www.google.com/calendar/event?eid=known",
+                "start": {"dateTime": "2025-01-01T10:00:00Z"},
+            }
+        ),
+        GoogleCalendarEvent(
+            {
+                "id": "new_event",
+                "summary": "New Event",
+                "htmlLink": "https://www.google.com/calendar/event?eid=new",
+                "start": {"dateTime": "2025-01-01T12:00:00Z"},
+            }
+        ),
+    ]
+
+    stats = await discord_client.sync_events(events, rebuild_mapping=False)
+
+    assert stats == {"total": 2, "created": 1, "skipped": 1, "failed": 0}
+    mock_channel.send.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_event_message_unregisters_all_keys(discord_client: DiscordClient) -> None:
+    """Test that deleting a message drops both its event ID and URL keys."""
+    discord_client._register("doomed_event", "doomed", 8000)
+    discord_client._msg_index["other_event"] = 8001
+
+    mock_channel = AsyncMock()
+    mock_channel.fetch_message = AsyncMock(return_value=AsyncMock())
+    discord_client.channel = mock_channel
+
+    assert await discord_client.delete_event_message("doomed_event")
+    assert discord_client._msg_index == {"other_event": 8001}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_event_mapping_stops_when_expected_found(
+    discord_client: DiscordClient,
+) -> None:
+    """Test that the history scan stops once every expected URL is found."""
+    messages = []
+    for i in range(3):
+        message = Mock()
+        message.author.id = 999
+        message.embeds = [Mock()]
+        message.embeds[0].url = f"https://www.google.com/calendar/event?eid=event{i}"
+        message.id = 2000 + i
+        messages.append(message)
+
+    scanned = []
+
+    async def history(limit: int):  # type: ignore[no-untyped-def]
+        for message in messages:
+            scanned.append(message.id)
+            yield message
+
+    mock_channel = Mock()
+    mock_channel.history = history
+    discord_client.channel = mock_channel
+    discord_client.client = Mock()
+    discord_client.client.user = Mock()
+    discord_client.client.user.id = 999
+
+    await discord_client.rebuild_event_mapping(
+        expected_urls={"https://www.google.com/calendar/event?eid=event0"}
+    )
+
+    assert scanned == [2000]
+    assert discord_client._msg_index == {"event0": 2000}
+
+
+@pytest.mark.asyncio
+async def test_sync_events_accepts_async_stream(discord_client: DiscordClient) -> None:
+    """Test that sync_events consumes an async stream after rebuilding the mapping."""
+    existing = Mock()
+    existing.author.id = 999
+    existing.embeds = [Mock()]
+    existing.embeds[0].url = "https://www.google.com/calendar/event?eid=posted"
+    existing.id = 9000
+
+    mock_new_message = Mock()
+    mock_new_message.id = 9001
+    mock_channel = Mock()
+    mock_channel.history.return_value = _aiter([existing])
+    mock_channel.send = AsyncMock(return_value=mock_new_message)
+    discord_client.channel = mock_channel
+    discord_client.client = Mock()
+    discord_client.client.user = Mock()
+    discord_client.client.user.id = 999
+
+    async def stream():  # type: ignore[no-untyped-def]
+        for eid in ("posted", "fresh"):
+            yield GoogleCalendarEvent(
+                {
+                    "id": f"{eid}_event",
+                    "htmlLink": f"https://www.google.com/calendar/event?eid={eid}",
+                    "start": {"dateTime": "2025-01-01T10:00:00Z"},
+                }
+            )
+
+    stats = await discord_client.sync_events(stream())
+
+    assert stats == {"total": 2, "created": 1, "skipped": 1, "failed": 0}
+    mock_channel.send.assert_called_once()
+
+
+def test_extract_eid() -> None:
+    """Test eid extraction regardless of query parameter order."""
+    assert _extract_eid("https://www.google.com/calendar/event?eid=abc123") == "abc123"
+    assert _extract_eid("https://www.google.com/calendar/event?eid=abc123&ctz=UTC") == "abc123"
+    assert _extract_eid("https://www.google.com/calendar/event?ctz=UTC&eid=abc123") == "abc123"
+    assert _extract_eid("https://example.com/event") is None
+
+
+@pytest.mark.asyncio
+async def test_sync_events_sends_concurrently(discord_client: DiscordClient) -> None:
+    """Test that new messages are sent with bounded concurrency."""
+    in_flight = 0
+    max_in_flight = 0
+    next_id = 10000
+
+    async def send(**kwargs):  # type: ignore[no-untyped-def]
+        nonlocal in_flight, max_in_flight, next_id
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        next_id += 1
+        message = Mock()
+        message.id = next_id
+        return message
+
+    mock_channel = AsyncMock()
+    mock_channel.send = send
+    discord_client.channel = mock_channel
+
+    events = [
+        GoogleCalendarEvent(
+            {
+                "id": f"event{i}",
+                "htmlLink": f"https://www.google.com/calendar/event?eid=e{i}",
+                "start": {"dateTime": "2025-01-01T10:00:00Z"},
+            }
+        )
+        for i in range(8)
+    ]
+
+    stats = await discord_client.sync_events(events, rebuild_mapping=False, max_concurrency=3)
+
+    assert stats == {"total": 8, "created": 8, "skipped": 0, "failed": 0}
+    assert max_in_flight == 3
+    assert len({discord_client._msg_index[f"event{i}"] for i in range(8)}) == 8
+
+
+@pytest.mark.asyncio
+async def test_upsert_event_retries_after_rate_limit(discord_client: DiscordClient) -> None:
+    """Test that a 429 pauses sending for the reset time and then retries."""
+    response = Mock(status=429, reason="Too Many Requests")
+    response.headers = {"X-RateLimit-Reset-After": "0"}
+    mock_message = Mock()
+    mock_message.id = 7001
+
+    mock_channel = AsyncMock()
+    mock_channel.send = AsyncMock(
+        side_effect=[discord.HTTPException(response, "rate limited"), mock_message]
+    )
+    discord_client.channel = mock_channel
+
+    event = GoogleCalendarEvent(
+        {
+            "id": "busy_event",
+            "htmlLink": "https://www.google.com/calendar/event?eid=busy",
+            "start": {"dateTime": "2025-01-01T10:00:00Z"},
+        }
+    )
+
+    assert await discord_client.upsert_event(event) == 7001
+    assert mock_channel.send.await_count == 2
+    assert discord_client._send_allowed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_sync_events_stops_workers_when_stream_fails(
+    discord_client: DiscordClient,
+) -> None:
+    """Test that no worker task outlives sync_events when the event stream fails."""
+
+    async def send(**kwargs):  # type: ignore[no-untyped-def]
+        await asyncio.Event().wait()
+
+    mock_channel = Mock()
+    mock_channel.send = send
+    discord_client.channel = mock_channel
+
+    async def stream():  # type: ignore[no-untyped-def]
+        yield GoogleCalendarEvent(
+            {
+                "id": "stuck_event",
+                "htmlLink": "https://www.google.com/calendar/event?eid=stuck",
+                "start": {"dateTime": "2025-01-01T10:00:00Z"},
+            }
+        )
+        await asyncio.sleep(0)
+        raise RuntimeError("calendar unavailable")
+
+    with pytest.raises(RuntimeError, match="calendar unavailable"):
+        await discord_client.sync_events(stream(), rebuild_mapping=False)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_keeps_known_messages(discord_client: DiscordClient) -> None:
+    """Test that a failed history scan doesn't cause already-posted events to be reposted."""
+
+    async def failing_history():  # type: ignore[no-untyped-def]
+        raise discord.HTTPException(Mock(status=503, reason="Service Unavailable"), "down")
+        yield
+
+    mock_new_message = Mock()
+    mock_new_message.id = 9100
+    mock_channel = Mock()
+    mock_channel.history.side_effect = [_aiter([]), failing_history()]
+    mock_channel.send = AsyncMock(return_value=mock_new_message)
+    discord_client.channel = mock_channel
+    discord_client.client = Mock()
+    discord_client.client.user = Mock()
+    discord_client.client.user.id = 999
+
+    event = GoogleCalendarEvent(
+        {
+            "id": "steady_event",
+            "htmlLink": "https://www.google.com/calendar/event?eid=steady",
+            "start": {"dateTime": "2025-01-01T10:00:00Z"},
+        }
+    )
+
+    first = await discord_client.sync_events([event])
+    second = await discord_client.sync_events([event])
+
+    assert first["created"] == 1
+    assert second == {"total": 1, "created": 0, "skipped": 1, "failed": 0}
+    mock_channel.send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_events_empty_source_skips_history(discord_client: DiscordClient) -> None:
+    """Test that syncing no events never reads the channel history."""
+    mock_channel = Mock()
+    discord_client.channel = mock_channel
+
+    async def stream():  # type: ignore[no-untyped-def]
+        return
+        yield
+
+    for events in (stream(), []):
+        stats = await discord_client.sync_events(events)
+        assert stats == {"total": 0, "created": 0, "skipped": 0, "failed": 0}
+
+    mock_channel.history.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_events_stream_stops_history_scan_early(
+    discord_client: DiscordClient,
+) -> None:
+    """Test that a streamed sync stops scanning history once all its events are found."""
+    messages = []
+    for i in range(5):
+        message = Mock()
+        message.author.id = 999
+        message.embeds = [Mock()]
+        message.embeds[0].url = f"https://www.google.com/calendar/event?eid=posted{i}"
+        message.id = 3000 + i
+        messages.append(message)
+
+    scanned = []
+
+    async def history(limit: int):  # type: ignore[no-untyped-def]
+        for message in messages:
+            # History pages are fetched over the network, so yield to the loop
+            await asyncio.sleep(0)
+            scanned.append(message.id)
+            yield message
+
+    mock_channel = Mock()
+    mock_channel.history = history
+    mock_channel.send = AsyncMock()
+    discord_client.channel = mock_channel
+    discord_client.client = Mock()
+    discord_client.client.user = Mock()
+    discord_client.client.user.id = 999
+
+    async def stream():  # type: ignore[no-untyped-def]
+        for i in range(2):
+            # Let the history scan start between events, as it would between pages
+            await asyncio.sleep(0)
+            yield GoogleCalendarEvent(
+                {
+                    "id": f"posted_event{i}",
+                    "htmlLink": f"https://www.google.com/calendar/event?eid=posted{i}",
+                    "start": {"dateTime": "2025-01-01T10:00:00Z"},
+                }
+            )
+
+    stats = await discord_client.sync_events(stream())
+
+    assert stats == {"total": 2, "created": 0, "skipped": 2, "failed": 0}
+    assert scanned == [3000, 3001]
+    mock_channel.send.assert_not_called()